@@ -17,13 +17,16 @@ The frontend can send a request like:
 """
 
 import asyncio
-import json
-
-from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from mcp_use import MCPAgent, MCPClient
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+logger = logging.getLogger(__name__)
 
 # Example configuration for a notes MCP server
 config = {
@@ -36,55 +39,54 @@ config = {
 }
 
 
+@lru_cache(maxsize=1)
+def get_client() -> MCPClient:
+    """Return the MCPClient shared by every request, creating it on first use."""
+    return MCPClient.from_dict(config)
+
+
+@lru_cache(maxsize=1)
+def get_llm() -> "ChatOpenAI":
+    """Return the LLM shared by every request, importing langchain_openai on first use."""
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model="gpt-4o")
+
+
 async def handle_request_with_payload(request_body: dict):
     """Handle a request from the frontend that includes payload data.
 
     Args:
         request_body: The request body from the frontend containing query and payload data
     """
-    # Load environment variables
-    load_dotenv()
-
     # Extract query and payload from request
     query = request_body.get("query", "")
     payload = request_body.get("payload")
 
-    print(f"Received query: {query}")
+    logger.info("Received query: %s", query)
     if payload:
         # Don't log sensitive data for security
-        print(
-            f"Payload provided with {len(payload)} keys: {list(payload.keys())}")
+        logger.debug("Payload provided with %d keys: %s", len(payload), list(payload.keys()))
     else:
-        print("No payload provided")
-
-    # Create MCPClient from configuration
-    client = MCPClient.from_dict(config)
-
-    # Create LLM
-    llm = ChatOpenAI(model="gpt-4o")
+        logger.debug("No payload provided")
 
     # Create agent - payload can be set at initialization
     agent = MCPAgent(
-        llm=llm,
-        client=client,
+        llm=get_llm(),
+        client=get_client(),
         max_steps=10,
         payload=payload  # The payload will be injected into tool calls
     )
 
-    try:
-        # Initialize the agent
-        await agent.initialize()
+    # Initialize the agent
+    await agent.initialize()
 
-        # Run the query - the payload will be automatically injected into any tool calls
-        # The LLM will not see the payload data in the prompts or responses
-        result = await agent.run(query)
+    # Run the query - the payload will be automatically injected into any tool calls
+    # The LLM will not see the payload data in the prompts or responses
+    result = await agent.run(query)
 
-        print(f"Result: {result}")
-        return result
-
-    finally:
-        # Clean up
-        await client.close_all_sessions()
+    logger.info("Result: %s", result)
+    return result
 
 
 async def handle_request_with_dynamic_payload(request_body: dict):
@@ -92,43 +94,32 @@ async def handle_request_with_dynamic_payload(request_body: dict):
 
     This approach is useful when you want to reuse the same agent instance
     but change the payload for different requests.
-    """
-    # Load environment variables
-    load_dotenv()
 
+    Args:
+        request_body: The request body from the frontend containing query and payload data
+    """
     # Extract query and payload from request
     query = request_body.get("query", "")
     payload = request_body.get("payload")
 
-    print(f"Received query: {query}")
-
-    # Create MCPClient from configuration
-    client = MCPClient.from_dict(config)
-
-    # Create LLM
-    llm = ChatOpenAI(model="gpt-4o")
+    logger.info("Received query: %s", query)
 
     # Create agent without payload initially
     agent = MCPAgent(
-        llm=llm,
-        client=client,
+        llm=get_llm(),
+        client=get_client(),
         max_steps=10
     )
 
-    try:
-        # Initialize the agent
-        await agent.initialize()
-
-        # Run the query with payload provided as parameter
-        # This will temporarily set the payload for this specific run
-        result = await agent.run(query, payload=payload)
+    # Initialize the agent
+    await agent.initialize()
 
-        print(f"Result: {result}")
-        return result
+    # Run the query with payload provided as parameter
+    # This will temporarily set the payload for this specific run
+    result = await agent.run(query, payload=payload)
 
-    finally:
-        # Clean up
-        await client.close_all_sessions()
+    logger.info("Result: %s", result)
+    return result
 
 
 async def main():
@@ -144,21 +135,49 @@ async def main():
         }
     }
 
-    print("=== Approach 1: Set payload at agent initialization ===")
-    await handle_request_with_payload(example_request)
-
-    print("\n=== Approach 2: Set payload dynamically per request ===")
-    await handle_request_with_dynamic_payload(example_request)
-
     # Example without payload
     example_request_no_payload = {
         "query": "List available tools",
         "payload": None
     }
 
-    print("\n=== Example without payload ===")
-    await handle_request_with_dynamic_payload(example_request_no_payload)
+    # Open the shared client's sessions a single time;
+    # every request below reuses the same live server processes
+    client = get_client()
+    await client.create_all_sessions()
+
+    try:
+        logger.info("=== Approach 1: Set payload at agent initialization ===")
+        await handle_request_with_payload(example_request)
+
+        logger.info("\n=== Approach 2: Set payload dynamically per request ===")
+        await handle_request_with_dynamic_payload(example_request)
+
+        logger.info("\n=== Example without payload ===")
+        await handle_request_with_dynamic_payload(example_request_no_payload)
+
+    finally:
+        # Clean up once, when the application shuts down
+        await client.close_all_sessions()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from dotenv import load_dotenv
+
+    # Load environment variables once for the whole process
+    load_dotenv()
+
+    # Show queries and results; use logging.DEBUG for payload details
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    try:
+        # uvloop schedules the concurrent LLM and MCP calls with less overhead
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        # Not available on Windows; fall back to the default asyncio event loop
+        loop_factory = None
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -5,21 +5,70 @@ This example shows how to integrate the payload injection functionality
 into a web server that receives requests from a frontend with payload data.
 
 The server will:
-1. Receive POST requests with query and payload
-2. Initialize an MCP agent with the payload
-3. Execute the query while automatically injecting the payload into tool calls
-4. Return the result without exposing the payload to the LLM
+1. Open the MCP sessions once at startup and keep them alive for its lifetime
+2. Build and initialize one MCP agent per model, shared by all requests
+3. Receive POST requests with query and payload
+4. Execute the query while automatically injecting the payload into tool calls
+5. Return the result without exposing the payload to the LLM
 """
 
 import asyncio
-import json
-from typing import Dict, Any
+import logging
+import re
 from dataclasses import dataclass
-
-from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-
-from mcp_use import MCPAgent, MCPClient
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from mcp_use import MCPAgent, MCPClient, SemanticCache
+from mcp_use.types.clientoptions import ClientOptions
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of requests processed at once; size it to the LLM provider's rate limit
+MAX_CONCURRENT_REQUESTS = 8
+
+DEFAULT_MODEL = "gpt-4o"
+# Cheaper and faster model for short questions that need no tools
+FAST_MODEL = "gpt-4o-mini"
+
+_TOOL_KEYWORDS = re.compile(
+    r"\b(notes?|inscri\w*|ajout\w*|list\w*|files?|fichiers?|tools?|servers?)\b",
+    re.IGNORECASE,
+)
+
+# Tools that only read from the servers of the example configs; the response of a run
+# is cached only if it called no other tool
+READONLY_TOOLS = frozenset(
+    {
+        # @modelcontextprotocol/server-everything
+        "echo",
+        "add",
+        # @modelcontextprotocol/server-filesystem
+        "read_file",
+        "read_multiple_files",
+        "list_directory",
+        "directory_tree",
+        "search_files",
+        "get_file_info",
+        "list_allowed_directories",
+    }
+)
+
+# Queries mentioning any of these words are never answered from the cache
+_MUTATING_INTENT = re.compile(
+    r"\b(add|create|write|save|store|insert|update|edit|modify|delete|remove|send|post|"
+    r"book|buy|pay|set|inscri\w*|ajout\w*|supprim\w*|enregistr\w*)\b",
+    re.IGNORECASE,
+)
+_TIME_DEPENDENT = re.compile(
+    r"\b(time|date|today|tonight|now|current\w*|latest|recent\w*|tomorrow|yesterday|"
+    r"weather|news|price\w*|heure|aujourd'hui|maintenant|actuel\w*|derni\w*|"
+    r"r[ée]cent\w*|m[ée]t[ée]o)\b",
+    re.IGNORECASE,
+)
 
 
 @dataclass
@@ -30,73 +79,149 @@ class RequestBody:
     payload: dict | None = None
 
 
+def choose_model(query: str) -> str:
+    """Pick the model for a query.
+
+    Short queries that mention nothing a tool would handle go to the fast model;
+    everything else stays on the default model, which is better at tool routing.
+
+    Args:
+        query: The user query
+
+    Returns:
+        The name of the model to answer the query with
+    """
+    if len(query) < 200 and not _TOOL_KEYWORDS.search(query):
+        return FAST_MODEL
+    return DEFAULT_MODEL
+
+
+def may_use_cache(query: str, payload: dict | None) -> bool:
+    """Check whether a query may be answered from the cache.
+
+    This is only a first filter: whether its response is stored still depends on
+    the tools the run calls.
+
+    Args:
+        query: The user query
+        payload: The payload of the request, if any
+
+    Returns:
+        True for queries without a payload that neither ask for a change nor
+        depend on the current time
+    """
+    return not payload and not _MUTATING_INTENT.search(query) and not _TIME_DEPENDENT.search(query)
+
+
+@lru_cache(maxsize=2)
+def get_llm(model: str = DEFAULT_MODEL) -> "ChatOpenAI":
+    """Return the LLM for a model, importing langchain_openai on first use."""
+    from langchain_openai import ChatOpenAI
+
+    # Route every request through the same prompt cache: the system prompt and
+    # tool schemas are identical across requests and only the query changes
+    return ChatOpenAI(model=model, extra_body={"prompt_cache_key": "mcp-agent-v1"})
+
+
 class MCPWebServer:
     """Web server that handles MCP requests with payload injection."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: dict[str, Any], options: ClientOptions | None = None):
         """Initialize the web server with MCP configuration.
 
         Args:
             config: MCP server configuration dictionary
+            options: Optional client options, e.g. an ``httpx_client_factory`` with
+                tuned connection limits for HTTP/SSE servers
         """
         self.config = config
-        self.client = MCPClient.from_dict(config)
-        self.llm = ChatOpenAI(model="gpt-4o")
+        self.client = MCPClient.from_dict(config, options=options)
+        # One agent per model for the lifetime of the server; the payload is passed
+        # per run. Memory is disabled so conversations from different users never mix.
+        self.agents = {
+            model: MCPAgent(
+                llm=get_llm(model),
+                client=self.client,
+                max_steps=15,
+                memory_enabled=False,
+                use_server_manager=True,  # Enable server manager for multi-server setups
+            )
+            for model in (DEFAULT_MODEL, FAST_MODEL)
+        }
+        # Responses to repeated read-only queries are reused for the same server set
+        self.cache = SemanticCache(threshold=0.95)
+        self.cache_key = SemanticCache.key_for_config(config)
 
-    async def handle_request(self, request_body: RequestBody) -> str:
-        """Handle a request from the frontend.
+    async def start(self) -> None:
+        """Open the MCP sessions and initialize the shared agents once."""
+        try:
+            await self.client.create_all_sessions()
+            for agent in self.agents.values():
+                await agent.initialize()
+                # Build the server manager's per-server tool cache before the first request
+                await agent.server_manager.prefetch_tools()
+        except BaseException:
+            # __aexit__ does not run when __aenter__ fails; stop the server processes here
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        """Close the MCP sessions when the server shuts down."""
+        await self.client.close_all_sessions()
+
+    async def __aenter__(self) -> "MCPWebServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def _run_agent(self, request_body: RequestBody) -> str:
+        """Run a query on the agent of its model, answering from the cache when safe.
+
+        Queries without a payload that pass ``may_use_cache`` are looked up in the
+        cache. A response is stored only if the run called nothing but read-only
+        tools; a run that called any other tool, or carried a payload, clears the
+        cached responses.
 
         Args:
             request_body: The request containing query and optional payload
 
         Returns:
-            The result from the MCP agent
+            The result from the MCP agent or the cache
         """
-        print(f"📝 Processing query: {request_body.query[:50]}...")
-
-        if request_body.payload:
-            # Log that we received payload (but don't log sensitive data for security)
-            print(
-                f"🔑 Payload provided with {len(request_body.payload)} keys: {list(request_body.payload.keys())}"
-            )
-
-        # Create agent with payload injection capability
-        agent = MCPAgent(
-            llm=self.llm,
-            client=self.client,
-            max_steps=15,
-            # Payload will be injected into tool calls
-            payload=request_body.payload,
-            use_server_manager=True,  # Enable server manager for multi-server setups
-        )
-
-        try:
-            # Initialize the agent
-            await agent.initialize()
-
-            # Execute the query
-            # The payload will be automatically injected into any tool calls
-            # The LLM will never see the payload data in prompts or responses
-            result = await agent.run(request_body.query)
+        query, payload = request_body.query, request_body.payload
+        embedding = None
+        if may_use_cache(query, payload):
+            # Embedding is CPU-bound; run it in a thread so concurrent requests keep going
+            embedding = await asyncio.to_thread(self.cache.embed, query)
+
+        cached = self.cache.get(embedding, self.cache_key)
+        if cached is not None:
+            logger.debug("⚡ Answered from the semantic cache")
+            return cached
+
+        generation = self.cache.generation(self.cache_key)
+        model = choose_model(query)
+        logger.debug("🧭 Routing query to %s", model)
+        agent = self.agents[model]
+        with agent.adapter.record_tool_calls() as called:
+            try:
+                result = await agent.run(query, payload=payload)
+            finally:
+                if payload or not READONLY_TOOLS.issuperset(called):
+                    # Even a failed run may have changed what the servers return
+                    self.cache.invalidate(self.cache_key)
+
+        if READONLY_TOOLS.issuperset(called):
+            self.cache.put(embedding, self.cache_key, result, generation)
+        return result
 
-            print(f"✅ Query completed successfully")
-            return result
-
-        except Exception as e:
-            print(f"❌ Error processing request: {e}")
-            return f"Error: {str(e)}"
-
-        finally:
-            # Always clean up resources
-            await self.client.close_all_sessions()
-
-    async def handle_request_with_dynamic_payload(
-        self, request_body: RequestBody
-    ) -> str:
-        """Alternative approach: set payload dynamically per request.
+    async def handle_request(self, request_body: RequestBody) -> str:
+        """Handle a request from the frontend.
 
-        This approach creates the agent once and reuses it, setting the payload
-        dynamically for each request. Useful for high-traffic scenarios.
+        The shared agents are reused; the payload and the selected server are scoped
+        to this execution only, so concurrent requests never see each other's.
 
         Args:
             request_body: The request containing query and optional payload
@@ -104,39 +229,33 @@ class MCPWebServer:
         Returns:
             The result from the MCP agent
         """
-        print(f"📝 Processing query (dynamic payload): {request_body.query[:50]}...")
+        logger.info("📝 Processing query: %.50s...", request_body.query)
 
-        # Create agent without payload initially
-        agent = MCPAgent(
-            llm=self.llm, client=self.client, max_steps=15, use_server_manager=True
-        )
+        if request_body.payload and logger.isEnabledFor(logging.DEBUG):
+            # Log that we received payload (but don't log sensitive data for security)
+            logger.debug(
+                "🔑 Payload provided with %d keys: %s",
+                len(request_body.payload),
+                list(request_body.payload.keys()),
+            )
 
         try:
-            # Initialize the agent
-            await agent.initialize()
-
-            # Execute with payload provided as parameter
-            # This temporarily sets the payload for this specific execution
-            result = await agent.run(request_body.query, payload=request_body.payload)
+            # Execute the query on the shared agent of the chosen model
+            # The payload will be automatically injected into any tool calls
+            # The LLM will never see the payload data in prompts or responses
+            result = await self._run_agent(request_body)
 
-            print(f"✅ Query completed successfully")
+            logger.info("✅ Query completed successfully")
             return result
 
         except Exception as e:
-            print(f"❌ Error processing request: {e}")
+            logger.error("❌ Error processing request: %s", e)
             return f"Error: {str(e)}"
 
-        finally:
-            # Clean up resources
-            await self.client.close_all_sessions()
-
 
 async def simulate_web_requests():
     """Simulate receiving web requests with different scenarios."""
 
-    # Load environment variables
-    load_dotenv()
-
     # Configuration for MCP servers
     config = {
         "mcpServers": {
@@ -151,9 +270,6 @@ async def simulate_web_requests():
         }
     }
 
-    # Create the web server
-    server = MCPWebServer(config)
-
     # Simulate different types of requests
     test_requests = [
         RequestBody(
@@ -173,27 +289,34 @@ async def simulate_web_requests():
         ),
     ]
 
-    print("🚀 Starting web server simulation...")
-    print("=" * 60)
+    logger.info("🚀 Starting web server simulation...")
+    logger.info("=" * 60)
+
+    # Sessions are opened once here and closed when the server shuts down
+    async with MCPWebServer(config) as server:
+        # Requests are independent, so process them concurrently while the
+        # semaphore keeps the number of in-flight LLM calls within budget
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def process(request: RequestBody) -> str:
+            async with semaphore:
+                return await server.handle_request(request)
 
-    for i, request in enumerate(test_requests, 1):
-        print(f"\n📨 Request {i}:")
-        print(f"Query: {request.query}")
-        print(f"Has payload: {'Yes' if request.payload else 'No'}")
-        print("-" * 40)
+        results = await asyncio.gather(*(process(request) for request in test_requests))
 
-        # Process the request
-        result = await server.handle_request(request)
-        print(f"Result: {result[:100]}...")
+    for i, (request, result) in enumerate(zip(test_requests, results, strict=True), 1):
+        logger.info("\n📨 Request %d:", i)
+        logger.info("Query: %s", request.query)
+        logger.info("Has payload: %s", "Yes" if request.payload else "No")
+        logger.info("-" * 40)
+        logger.info("Result: %.100s...", result)
 
-        print("=" * 60)
+        logger.info("=" * 60)
 
 
 async def simulate_high_traffic_scenario():
     """Simulate a high-traffic scenario with payload reuse."""
 
-    load_dotenv()
-
     config = {
         "mcpServers": {
             "everything": {
@@ -203,8 +326,6 @@ async def simulate_high_traffic_scenario():
         }
     }
 
-    server = MCPWebServer(config)
-
     # Simulate multiple rapid requests
     requests = [
         RequestBody(
@@ -214,29 +335,49 @@ async def simulate_high_traffic_scenario():
         for i in range(3)
     ]
 
-    print("🚀 High-traffic simulation:")
-    print("=" * 40)
-
-    # Process requests concurrently (in a real scenario)
-    tasks = []
-    for request in requests:
-        task = server.handle_request_with_dynamic_payload(request)
-        tasks.append(task)
+    logger.info("🚀 High-traffic simulation:")
+    logger.info("=" * 40)
 
-    # Wait for all requests to complete
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    async with MCPWebServer(config) as server:
+        # Process requests concurrently; if one fails unexpectedly the task group
+        # cancels its peers before the sessions are closed
+        try:
+            async with asyncio.TaskGroup() as tg:
+                handles = [tg.create_task(server.handle_request(request)) for request in requests]
+        except* Exception as eg:
+            for error in eg.exceptions:
+                logger.error("❌ Request failed: %s", error)
+            handles = []
 
-    for i, result in enumerate(results):
-        print(f"Request {i+1} result: {str(result)[:100]}...")
+    for i, handle in enumerate(handles):
+        logger.info("Request %d result: %.100s...", i + 1, handle.result())
 
 
 if __name__ == "__main__":
-    print("🌐 MCP Web Server with Payload Injection")
-    print("This example demonstrates secure payload handling in web applications.\n")
+    from dotenv import load_dotenv
+
+    # Load environment variables once for the whole process
+    load_dotenv()
+
+    # Show the request lifecycle; use logging.DEBUG for per-request details
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    logger.info("🌐 MCP Web Server with Payload Injection")
+    logger.info("This example demonstrates secure payload handling in web applications.\n")
+
+    try:
+        # uvloop schedules the many concurrent LLM and MCP calls with less overhead
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        # Not available on Windows; fall back to the default asyncio event loop
+        loop_factory = None
 
-    # Run the web server simulation
-    asyncio.run(simulate_web_requests())
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        # Run the web server simulation
+        runner.run(simulate_web_requests())
 
-    print("\n" + "=" * 60)
-    print("🔄 High-traffic scenario simulation:")
-    asyncio.run(simulate_high_traffic_scenario())
+        logger.info("\n" + "=" * 60)
+        logger.info("🔄 High-traffic scenario simulation:")
+        runner.run(simulate_high_traffic_scenario())
@@ -8,6 +8,7 @@ to MCP tools through existing LangChain adapters.
 from importlib.metadata import version
 
 from .agents.mcpagent import MCPAgent
+from .cache import SemanticCache
 from .client import MCPClient
 from .config import load_config_file
 from .connectors import BaseConnector, HttpConnector, StdioConnector, WebSocketConnector
@@ -20,6 +21,7 @@ __all__ = [
     "MCPAgent",
     "MCPClient",
     "MCPSession",
+    "SemanticCache",
     "BaseConnector",
     "StdioConnector",
     "WebSocketConnector",
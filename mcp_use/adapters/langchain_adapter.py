@@ -5,6 +5,9 @@ This module provides utilities to convert MCP tools to LangChain tools.
 """
 
 import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, NoReturn
 
 from jsonschema_pydantic import jsonschema_to_pydantic
@@ -24,10 +27,18 @@ from ..connectors.base import BaseConnector
 from ..logging import logger
 from .base import BaseAdapter
 
+# Payload of the current run; isolated per asyncio task so concurrent runs sharing
+# an adapter never see each other's payload
+_run_payload: ContextVar[dict | None] = ContextVar("mcp_use_run_payload", default=None)
+# Names of the MCP tools called in the current context while ``record_tool_calls`` is active
+_run_tool_calls: ContextVar[list[str] | None] = ContextVar("mcp_use_run_tool_calls", default=None)
+
 
 class LangChainAdapter(BaseAdapter):
     """Adapter for converting MCP tools to LangChain tools."""
 
+    _run_payload = _run_payload
+
     def __init__(self, disallowed_tools: list[str] | None = None, payload: dict | None = None) -> None:
         """Initialize a new LangChain adapter.
 
@@ -39,6 +50,38 @@ class LangChainAdapter(BaseAdapter):
         self._connector_tool_map: dict[BaseConnector, list[BaseTool]] = {}
         self.payload = payload
 
+    @property
+    def active_payload(self) -> dict | None:
+        """Get the payload to inject, preferring the one scoped to the current run.
+
+        Returns:
+            The run payload if one is set, otherwise the adapter-wide payload.
+        """
+        run_payload = self._run_payload.get()
+        return run_payload if run_payload is not None else self.payload
+
+    @staticmethod
+    @contextmanager
+    def record_tool_calls() -> Iterator[list[str]]:
+        """Collect the names of the MCP tools called within the block.
+
+        Calls made by agent runs started in the block, including from the tasks
+        they spawn, are appended in call order. A tool is recorded before it is
+        called, so a call that failed is listed too.
+
+        Yields:
+            The list the tool names are appended to.
+        """
+        outer = _run_tool_calls.get()
+        calls: list[str] = []
+        token = _run_tool_calls.set(calls)
+        try:
+            yield calls
+        finally:
+            _run_tool_calls.reset(token)
+            if outer is not None:
+                outer.extend(calls)
+
     def fix_schema(self, schema: dict) -> dict:
         """Convert JSON Schema 'type': ['string', 'null'] to 'anyOf' format.
 
@@ -159,11 +202,16 @@ class LangChainAdapter(BaseAdapter):
                 logger.debug(
                     f'MCP tool: "{self.name}" received input: {kwargs}')
 
+                calls = _run_tool_calls.get()
+                if calls is not None:
+                    calls.append(self.name)
+
                 try:
                     # Inject payload if available
-                    if adapter_self.payload:
+                    payload = adapter_self.active_payload
+                    if payload:
                         # Add payload data to the arguments if not already present
-                        for key, value in adapter_self.payload.items():
+                        for key, value in payload.items():
                             if key not in kwargs:
                                 kwargs[key] = value
                                 logger.debug(
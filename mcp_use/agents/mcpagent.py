@@ -5,8 +5,10 @@ This module provides the main MCPAgent class that integrates all components
 to provide a simple interface for using MCP tools with different LLMs.
 """
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
+from contextlib import ExitStack, aclosing, contextmanager
 
 from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain.agents.output_parsers.tools import ToolAgentAction
@@ -31,6 +33,9 @@ from .prompts.templates import DEFAULT_SYSTEM_PROMPT_TEMPLATE, SERVER_MANAGER_SY
 
 set_debug(logger.level == logging.DEBUG)
 
+# Marks the end of a stream handed over from the producer task in ``astream``
+_STREAM_END = object()
+
 
 class MCPAgent:
     """Main class for using MCP tools with various LLM providers.
@@ -227,6 +232,9 @@ class MCPAgent:
         if self._system_message:
             system_content = self._system_message.content
 
+        # Keep the static system prompt (with the tool descriptions) first and every
+        # per-request part after it, so providers can cache it as a stable prefix.
+        # Payload data is injected into tool arguments and never enters the prompt.
         prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", system_content),
@@ -336,12 +344,32 @@ class MCPAgent:
         """
         return self.disallowed_tools
 
+    @contextmanager
+    def _run_scope(self, payload: dict | None = None) -> Iterator[None]:
+        """Scope the payload and the active server to a single run.
+
+        Concurrent runs on a shared agent each see their own payload and server
+        selection. The selected server outlives the run only when memory is enabled,
+        so that a conversation can carry on with the server it was using.
+
+        Args:
+            payload: Optional payload to inject into tool calls for this run only.
+        """
+        with ExitStack() as stack:
+            if payload is not None:
+                token = self.adapter._run_payload.set(payload)
+                stack.callback(self.adapter._run_payload.reset, token)
+            if self.server_manager:
+                stack.enter_context(self.server_manager.run_scope(persist=self.memory_enabled))
+            yield
+
     async def _generate_response_chunks_async(
         self,
         query: str,
         max_steps: int | None = None,
         manage_connector: bool = True,
         external_history: list[BaseMessage] | None = None,
+        payload: dict | None = None,
     ) -> AsyncIterator[StreamEvent]:
         """Internal async generator yielding response chunks.
 
@@ -380,14 +408,16 @@ class MCPAgent:
         inputs = {"input": query, "chat_history": history_to_use}
 
         # 3. Stream & diff -------------------------------------------------------
-        async for event in self._agent_executor.astream_events(inputs):
-            if event.get("event") == "on_chain_end":
-                output = event["data"]["output"]
-                if isinstance(output, list):
-                    for message in output:
-                        if not isinstance(message, ToolAgentAction):
-                            self.add_to_history(message)
-            yield event
+        # Scope the payload and active server to this stream, exactly as ``run`` does
+        with self._run_scope(payload):
+            async for event in self._agent_executor.astream_events(inputs):
+                if event.get("event") == "on_chain_end":
+                    output = event["data"]["output"]
+                    if isinstance(output, list):
+                        for message in output:
+                            if not isinstance(message, ToolAgentAction):
+                                self.add_to_history(message)
+                yield event
 
         # 5. House-keeping -------------------------------------------------------
         if initialised_here and manage_connector:
@@ -399,21 +429,55 @@ class MCPAgent:
         max_steps: int | None = None,
         manage_connector: bool = True,
         external_history: list[BaseMessage] | None = None,
+        payload: dict | None = None,
     ) -> AsyncIterator[str]:
         """Asynchronous streaming interface.
 
+        Args:
+            payload: Optional payload to inject into tool calls for this stream only,
+                with the same semantics as in ``run``.
+
         Example::
 
             async for chunk in agent.astream("hello"):
                 print(chunk, end="|", flush=True)
         """
-        async for chunk in self._generate_response_chunks_async(
-            query=query,
-            max_steps=max_steps,
-            manage_connector=manage_connector,
-            external_history=external_history,
-        ):
-            yield chunk
+        # Run the whole stream in its own task so the run scope is entered and left
+        # in one context, even when the caller stops early and the generator is
+        # finalized from another task. The queue is bounded, so a slow caller makes the
+        # run wait instead of buffering every event.
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=16)
+
+        async def produce() -> None:
+            try:
+                async with aclosing(
+                    self._generate_response_chunks_async(
+                        query=query,
+                        max_steps=max_steps,
+                        manage_connector=manage_connector,
+                        external_history=external_history,
+                        payload=payload,
+                    )
+                ) as stream:
+                    async for chunk in stream:
+                        await chunks.put(chunk)
+            except asyncio.CancelledError:
+                # Only cancelled once the caller has stopped reading; no one awaits the end
+                raise
+            except BaseException:
+                await chunks.put(_STREAM_END)
+                raise
+            await chunks.put(_STREAM_END)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (chunk := await chunks.get()) is not _STREAM_END:
+                yield chunk
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
 
     async def run(
         self,
@@ -428,7 +492,8 @@ class MCPAgent:
         This method handles connecting to the MCP server, initializing the agent,
         running the query, and then cleaning up the connection.        Args:
             query: The query to run.
-            payload: Optional payload to inject into tool calls for this run.
+            payload: Optional payload to inject into tool calls for this run only.
+                It takes precedence over the agent-wide payload and is not kept after the run.
             max_steps: Optional maximum number of steps to take.
             manage_connector: Whether to handle the connector lifecycle internally.
                 If True, this method will connect, initialize, and disconnect from
@@ -442,10 +507,11 @@ class MCPAgent:
         """
         result = ""
         initialized_here = False
+        run_scope = ExitStack()
         try:
-            # Set payload if provided for this run
-            if payload is not None:
-                self.set_payload(payload)
+            # Scope the payload and active server so concurrent runs on a shared agent
+            # stay isolated
+            run_scope.enter_context(self._run_scope(payload))
 
             # Initialize if needed
             if manage_connector and not self._initialized:
@@ -613,6 +679,8 @@ class MCPAgent:
             raise
 
         finally:
+            run_scope.close()
+
             # Clean up if necessary (e.g., if not using client-managed sessions)
             if manage_connector and not self.client and not initialized_here:
                 logger.info("🧹 Closing agent after query completion")
@@ -0,0 +1,3 @@
+from .semantic_cache import SemanticCache
+
+__all__ = ["SemanticCache"]
@@ -0,0 +1,235 @@
+"""
+Semantic response cache for MCP agents.
+
+This module provides a cache that returns a previous agent response when a new
+query is semantically close enough to one that was already answered.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from ..logging import logger
+
+
+@dataclass
+class _CacheEntry:
+    vector: np.ndarray
+    response: str
+    created_at: float
+
+
+class SemanticCache:
+    """Cache of agent responses keyed by query embedding similarity.
+
+    Entries are partitioned by a cache key (typically a hash of the MCP server
+    configuration) so that a response is only reused for the same set of servers.
+    The cache does not know which queries are safe to answer twice: only store
+    responses of runs that called read-only tools, and call ``invalidate`` once a
+    run has called any other tool.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries: int = 256,
+        ttl: float | None = 300.0,
+        embedding_function: Callable[[list[str]], list[Any]] | None = None,
+    ) -> None:
+        """Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cached response to be reused.
+            max_entries: Maximum number of cached responses; the oldest are evicted first.
+            ttl: Seconds after which a cached response expires, or None to keep
+                responses until they are evicted or invalidated.
+            embedding_function: Function mapping a list of texts to embedding vectors.
+                If None, a local fastembed model is loaded on first use.
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.embedding_function = embedding_function
+        self.model = None
+        # Callers embed from worker threads; load the model only once
+        self._model_lock = threading.Lock()
+        # Entries of each partition, oldest first
+        self._entries: dict[str, list[_CacheEntry]] = {}
+        self._size = 0
+        # Bumped by invalidate so responses computed before it are not stored
+        self._generations: dict[str, int] = {}
+
+    @staticmethod
+    def key_for_config(config: dict[str, Any]) -> str:
+        """Build a cache key identifying a server configuration.
+
+        Args:
+            config: The MCP client configuration dictionary.
+
+        Returns:
+            A stable hash of the configuration.
+        """
+        encoded = json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _load_model(self) -> bool:
+        """Load the embedding model if no embedding function was provided."""
+        if self.embedding_function is not None:
+            return True
+
+        with self._model_lock:
+            if self.embedding_function is not None:
+                return True
+
+            try:
+                from fastembed import TextEmbedding  # optional dependency install with [search]
+            except ImportError:
+                logger.error(
+                    "The 'fastembed' library is not installed. "
+                    "To use the semantic cache, please install it by running: "
+                    "pip install mcp-use[search]"
+                )
+                return False
+
+            try:
+                self.model = TextEmbedding(model_name="BAAI/bge-small-en-v1.5")
+                self.embedding_function = lambda texts: list(self.model.embed(texts))
+                return True
+            except Exception as e:
+                logger.error(f"Failed to load the embedding model: {e}")
+                return False
+
+    def embed(self, query: str) -> np.ndarray | None:
+        """Compute the normalized embedding of a query.
+
+        Args:
+            query: The user query.
+
+        Returns:
+            The unit-length embedding, or None if embeddings are unavailable.
+        """
+        if not self._load_model():
+            return None
+
+        normalized = " ".join(query.lower().split())
+        try:
+            embedding = np.asarray(self.embedding_function([normalized])[0], dtype=np.float32)
+        except Exception as e:
+            logger.error(f"Failed to embed query for the semantic cache: {e}")
+            return None
+
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm else None
+
+    def generation(self, cache_key: str) -> int:
+        """Return the invalidation generation of a partition.
+
+        Read it before running a query and pass it to ``put``, so that a response
+        computed while the partition was invalidated is not stored.
+
+        Args:
+            cache_key: The key of the partition.
+
+        Returns:
+            A number that changes every time the partition is invalidated.
+        """
+        return self._generations.get(cache_key, 0)
+
+    def get(self, embedding: np.ndarray | None, cache_key: str) -> str | None:
+        """Look up a response for a query embedding.
+
+        Args:
+            embedding: The query embedding returned by ``embed``.
+            cache_key: The key of the partition to search.
+
+        Returns:
+            The cached response of the most similar query above the threshold, or None.
+        """
+        if embedding is None:
+            return None
+
+        self._expire(cache_key)
+        entries = self._entries.get(cache_key)
+        if not entries:
+            return None
+
+        scores = np.stack([entry.vector for entry in entries]) @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        logger.debug(f"Semantic cache hit with similarity {scores[best]:.3f}")
+        return entries[best].response
+
+    def put(
+        self,
+        embedding: np.ndarray | None,
+        cache_key: str,
+        response: str,
+        generation: int | None = None,
+    ) -> None:
+        """Store a response for a query embedding.
+
+        Args:
+            embedding: The query embedding returned by ``embed``.
+            cache_key: The key of the partition to store the response in.
+            response: The agent response to cache.
+            generation: The value of ``generation(cache_key)`` read before the query
+                ran. If the partition was invalidated since, the response is dropped.
+        """
+        if embedding is None:
+            return
+        if generation is not None and generation != self.generation(cache_key):
+            return
+
+        entry = _CacheEntry(embedding, response, time.monotonic())
+        self._entries.setdefault(cache_key, []).append(entry)
+        self._size += 1
+
+        # Evict the oldest entries once over capacity
+        while self._size > self.max_entries:
+            oldest_key = min(self._entries, key=lambda key: self._entries[key][0].created_at)
+            self._drop(oldest_key, 1)
+
+    def invalidate(self, cache_key: str) -> None:
+        """Remove all cached responses of a partition.
+
+        Args:
+            cache_key: The key of the partition to clear.
+        """
+        self._generations[cache_key] = self.generation(cache_key) + 1
+        self._drop(cache_key, len(self._entries.get(cache_key, ())))
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        for cache_key in list(self._entries):
+            self.invalidate(cache_key)
+
+    def _expire(self, cache_key: str) -> None:
+        """Remove the expired entries of a partition."""
+        entries = self._entries.get(cache_key)
+        if self.ttl is None or not entries:
+            return
+
+        deadline = time.monotonic() - self.ttl
+        expired = 0
+        while expired < len(entries) and entries[expired].created_at <= deadline:
+            expired += 1
+        self._drop(cache_key, expired)
+
+    def _drop(self, cache_key: str, count: int) -> None:
+        """Remove the ``count`` oldest entries of a partition."""
+        if not count:
+            return
+
+        entries = self._entries[cache_key]
+        del entries[:count]
+        self._size -= count
+        if not entries:
+            del self._entries[cache_key]
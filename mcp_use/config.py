@@ -72,6 +72,7 @@ def create_connector_from_config(
             base_url=server_config["url"],
             headers=server_config.get("headers", None),
             auth_token=server_config.get("auth_token", None),
+            httpx_client_factory=options.get("httpx_client_factory"),
         )
 
     # WebSocket connector
@@ -9,6 +9,7 @@ from mcp import ClientSession
 
 from ..logging import logger
 from ..task_managers import SseConnectionManager
+from ..types.clientoptions import HttpClientFactory
 from .base import BaseConnector
 
 
@@ -26,6 +27,7 @@ class HttpConnector(BaseConnector):
         headers: dict[str, str] | None = None,
         timeout: float = 5,
         sse_read_timeout: float = 60 * 5,
+        httpx_client_factory: HttpClientFactory | None = None,
     ):
         """Initialize a new HTTP connector.
 
@@ -35,6 +37,8 @@ class HttpConnector(BaseConnector):
             headers: Optional additional headers.
             timeout: Timeout for HTTP operations in seconds.
             sse_read_timeout: Timeout for SSE read operations in seconds.
+            httpx_client_factory: Optional factory for the httpx client, e.g. to tune
+                connection pool limits. Defaults to the MCP SDK client. Requires mcp>=1.9.2.
         """
         super().__init__()
         self.base_url = base_url.rstrip("/")
@@ -44,6 +48,7 @@ class HttpConnector(BaseConnector):
             self.headers["Authorization"] = f"Bearer {auth_token}"
         self.timeout = timeout
         self.sse_read_timeout = sse_read_timeout
+        self.httpx_client_factory = httpx_client_factory
 
     async def connect(self) -> None:
         """Establish a connection to the MCP implementation."""
@@ -58,7 +63,11 @@ class HttpConnector(BaseConnector):
 
             # Create and start the connection manager
             self._connection_manager = SseConnectionManager(
-                sse_url, self.headers, self.timeout, self.sse_read_timeout
+                sse_url,
+                self.headers,
+                self.timeout,
+                self.sse_read_timeout,
+                httpx_client_factory=self.httpx_client_factory,
             )
             read_stream, write_stream = await self._connection_manager.start()
 
@@ -1,3 +1,7 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from langchain_core.tools import BaseTool
 
 from mcp_use.client import MCPClient
@@ -13,6 +17,12 @@ from .tools import (
     UseToolFromServerTool,
 )
 
+# Active server of each manager for the current run; isolated per asyncio task so
+# concurrent runs on a shared agent never switch each other's server
+_run_active_servers: ContextVar[dict["ServerManager", str | None] | None] = ContextVar(
+    "mcp_use_run_active_servers", default=None
+)
+
 
 class ServerManager:
     """Manages MCP servers and provides tools for server selection and management.
@@ -30,16 +40,64 @@ class ServerManager:
         """
         self.client = client
         self.adapter = adapter
-        self.active_server: str | None = None
+        self._active_server: str | None = None
         self.initialized_servers: dict[str, bool] = {}
         self._server_tools: dict[str, list[BaseTool]] = {}
 
+    @property
+    def active_server(self) -> str | None:
+        """Get the active server, preferring the one selected in the current run.
+
+        Returns:
+            The name of the active server, or None if no server is active.
+        """
+        run_servers = _run_active_servers.get()
+        if run_servers is not None and self in run_servers:
+            return run_servers[self]
+        return self._active_server
+
+    @active_server.setter
+    def active_server(self, server_name: str | None) -> None:
+        run_servers = _run_active_servers.get()
+        if run_servers is not None and self in run_servers:
+            run_servers[self] = server_name
+        else:
+            self._active_server = server_name
+
+    @contextmanager
+    def run_scope(self, persist: bool = False) -> Iterator[None]:
+        """Scope server selection to a single agent run.
+
+        Inside the scope the run starts from the manager-wide active server, and
+        connecting or disconnecting only affects the current run.
+
+        Args:
+            persist: Whether to keep the run's active server once the run ends.
+        """
+        run_servers = dict(_run_active_servers.get() or {})
+        run_servers[self] = self._active_server
+        token = _run_active_servers.set(run_servers)
+        try:
+            yield
+        finally:
+            _run_active_servers.reset(token)
+            if persist:
+                self._active_server = run_servers[self]
+
     async def initialize(self) -> None:
         """Initialize the server manager and prepare server management tools."""
         # Make sure we have server configurations
         if not self.client.get_server_names():
             logger.warning("No MCP servers defined in client configuration")
 
+    async def prefetch_tools(self) -> None:
+        """Load the tools of every configured server ahead of the first query.
+
+        Long-lived agents can call this once at startup so that connecting to a
+        server or searching for tools never has to list tools on the request path.
+        """
+        await self._prefetch_server_tools()
+
     async def _prefetch_server_tools(self) -> None:
         """Pre-fetch tools for all servers to populate the tool search index."""
         servers = self.client.get_server_names()
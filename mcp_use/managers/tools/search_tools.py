@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import time
 from typing import ClassVar
 
@@ -100,6 +101,8 @@ class ToolSearchEngine:
         # Initialize model components (loaded on demand)
         self.model = None
         self.embedding_function = None
+        # Indexing and searches load the model from worker threads; load it only once
+        self._model_lock = threading.Lock()
 
         # Data storage
         self.tool_embeddings = {}  # Maps tool name to embedding vector
@@ -113,23 +116,29 @@ class ToolSearchEngine:
         if self.model is not None:
             return True
 
-        try:
-            from fastembed import TextEmbedding  # optional dependency install with [search]
-        except ImportError:
-            logger.error(
-                "The 'fastembed' library is not installed. "
-                "To use the search functionality, please install it by running: "
-                "pip install mcp-use[search]"
-            )
-            return False
+        with self._model_lock:
+            if self.model is not None:
+                return True
 
-        try:
-            self.model = TextEmbedding(model_name="BAAI/bge-small-en-v1.5")
-            self.embedding_function = lambda texts: list(self.model.embed(texts))
-            return True
-        except Exception as e:
-            logger.error(f"Failed to load the embedding model: {e}")
-            return False
+            try:
+                from fastembed import TextEmbedding  # optional dependency install with [search]
+            except ImportError:
+                logger.error(
+                    "The 'fastembed' library is not installed. "
+                    "To use the search functionality, please install it by running: "
+                    "pip install mcp-use[search]"
+                )
+                return False
+
+            try:
+                model = TextEmbedding(model_name="BAAI/bge-small-en-v1.5")
+                self.embedding_function = lambda texts: list(model.embed(texts))
+                # Set last: other threads take a non-None model as fully loaded
+                self.model = model
+                return True
+            except Exception as e:
+                logger.error(f"Failed to load the embedding model: {e}")
+                return False
 
     async def start_indexing(self) -> None:
         """Index the tools from the server manager."""
@@ -177,13 +186,14 @@ class ToolSearchEngine:
         if not self.tool_texts:
             return
 
-        # Generate embeddings
-        if self._load_model():
+        # Generate embeddings; model loading and inference are CPU-bound, so run them
+        # in a worker thread to keep the event loop free for other requests
+        if await asyncio.to_thread(self._load_model):
             tool_names = list(self.tool_texts.keys())
             tool_texts = [self.tool_texts[name] for name in tool_names]
 
             try:
-                embeddings = self.embedding_function(tool_texts)
+                embeddings = await asyncio.to_thread(self.embedding_function, tool_texts)
                 for name, embedding in zip(tool_names, embeddings, strict=True):
                     self.tool_embeddings[name] = embedding
 
@@ -289,7 +299,8 @@ class ToolSearchEngine:
         ):
             active_server = self.server_manager.active_server
 
-        results = self.search(query, top_k=top_k)
+        # Embedding the query is CPU-bound, keep it off the event loop
+        results = await asyncio.to_thread(self.search, query, top_k)
         if not results:
             return (
                 "No relevant tools found. The search provided no results. "
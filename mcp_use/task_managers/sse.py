@@ -10,6 +10,7 @@ from typing import Any
 from mcp.client.sse import sse_client
 
 from ..logging import logger
+from ..types.clientoptions import HttpClientFactory
 from .base import ConnectionManager
 
 
@@ -27,6 +28,7 @@ class SseConnectionManager(ConnectionManager[tuple[Any, Any]]):
         headers: dict[str, str] | None = None,
         timeout: float = 5,
         sse_read_timeout: float = 60 * 5,
+        httpx_client_factory: HttpClientFactory | None = None,
     ):
         """Initialize a new SSE connection manager.
 
@@ -35,12 +37,15 @@ class SseConnectionManager(ConnectionManager[tuple[Any, Any]]):
             headers: Optional HTTP headers
             timeout: Timeout for HTTP operations in seconds
             sse_read_timeout: Timeout for SSE read operations in seconds
+            httpx_client_factory: Optional factory for the httpx client that carries
+                the SSE stream and the message POSTs of this connection
         """
         super().__init__()
         self.url = url
         self.headers = headers or {}
         self.timeout = timeout
         self.sse_read_timeout = sse_read_timeout
+        self.httpx_client_factory = httpx_client_factory
         self._sse_ctx = None
 
     async def _establish_connection(self) -> tuple[Any, Any]:
@@ -52,12 +57,18 @@ class SseConnectionManager(ConnectionManager[tuple[Any, Any]]):
         Raises:
             Exception: If connection cannot be established.
         """
+        # Only forward the factory when one is set: sse_client accepts it since mcp 1.9.2
+        kwargs = {}
+        if self.httpx_client_factory is not None:
+            kwargs["httpx_client_factory"] = self.httpx_client_factory
+
         # Create the context manager
         self._sse_ctx = sse_client(
             url=self.url,
             headers=self.headers,
             timeout=self.timeout,
             sse_read_timeout=self.sse_read_timeout,
+            **kwargs,
         )
 
         # Enter the context manager
@@ -4,10 +4,27 @@ Options for MCP client configuration.
 This module provides data classes and type definitions for configuring the MCP client.
 """
 
-from typing import NotRequired, TypedDict
+from typing import TYPE_CHECKING, NotRequired, Protocol, TypedDict
 
 from .sandbox import SandboxOptions
 
+if TYPE_CHECKING:
+    import httpx
+
+
+class HttpClientFactory(Protocol):
+    """Callable that creates the httpx client of an HTTP/SSE connection.
+
+    It receives the keyword arguments the MCP SDK passes to its own default factory.
+    """
+
+    def __call__(
+        self,
+        headers: dict[str, str] | None = None,
+        timeout: "httpx.Timeout | None" = None,
+        auth: "httpx.Auth | None" = None,
+    ) -> "httpx.AsyncClient": ...
+
 
 class ClientOptions(TypedDict):
     """Options for configuring the MCP client.
@@ -21,3 +38,7 @@ class ClientOptions(TypedDict):
 
     sandbox_options: NotRequired[SandboxOptions]
     """Options for sandbox configuration when is_sandboxed=True."""
+
+    httpx_client_factory: NotRequired[HttpClientFactory]
+    """Factory for the httpx client used by HTTP/SSE connectors, e.g. to set pool limits.
+    Requires mcp>=1.9.2, the first release whose SSE client accepts a factory."""
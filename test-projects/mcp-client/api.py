@@ -1,18 +1,37 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Any
 from contextlib import asynccontextmanager
-from client import MCPUSE_CLIENT
+from pathlib import Path
 import json
+import os
+from client import MCPUSE_CLIENT
 
 import mcp_use
 
 mcp_use.set_debug(1)
 
-with open("../servers-config/config.json") as f:
-    config = json.load(f)
-    print(f"Config: {config}")
+try:
+    import orjson  # noqa: F401  # optional, install with `pip install orjson`
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
+# Resolved from this file rather than the working directory, and parsed once at import
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "servers-config" / "config.json"
+config = mcp_use.load_config_file(CONFIG_PATH)
+
+# Comma-separated list of frontend origins allowed to call the API, parsed once at startup
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+
+# Open the connections to OpenAI at startup; set MCP_WARMUP=0 in CI to skip the LLM call
+WARMUP = os.getenv("MCP_WARMUP", "1") != "0"
 
 
 @asynccontextmanager
@@ -20,6 +39,7 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for the FastAPI application."""
     client = MCPUSE_CLIENT(config=config)
     try:
+        await client.start(warm_up=WARMUP)
         app.state.client = client
         yield
     except Exception as e:
@@ -29,38 +49,57 @@ async def lifespan(app: FastAPI):
         await client.client.close_all_sessions()
         print("Client shutdown successfully.")
 
-app = FastAPI(title="MCP Client API", lifespan=lifespan)
+# orjson serializes long results and nested payloads much faster than the stdlib json
+app = FastAPI(title="MCP Client API", lifespan=lifespan, default_response_class=DefaultResponse)
 
 # Add CORS middleware
+# Explicit origins, methods and headers: credentials cannot be combined with "*"
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Update this for production
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
 )
 
 
 class QueryRequest(BaseModel):
     query: str
-    payload: Dict[str, Any] = {}
+    payload: dict[str, Any] = {}
 
 
 @app.post("/query")
 async def process_query(request: QueryRequest):
-    """Process a query using the MCP client with access token."""
+    """Process a query using the MCP client, injecting the payload into tool calls."""
     try:
-        # Pass the access token to the process_query method
         result = await app.state.client.process_query(
             query=request.query,
             payload=request.payload
         )
-        print(f"Result: {result}")
         return {"result": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/query/stream")
+async def stream_query(request: QueryRequest):
+    """Stream the answer to a query as server-sent events while it is generated."""
+
+    async def events():
+        try:
+            async for delta in app.state.client.stream_query(
+                query=request.query,
+                payload=request.payload
+            ):
+                yield f"data: {json.dumps({'delta': delta})}\n\n"
+            yield "event: done\ndata: {}\n\n"
+        except Exception as e:
+            # The status code is already sent, so report failures in-band
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app=app, host="0.0.0.0", port=8000, log_level="info")
@@ -1,5 +1,9 @@
-from mcp_use import MCPAgent, MCPClient
+import asyncio
+from collections.abc import AsyncIterator
+import httpx
+from mcp_use import MCPAgent, MCPClient, SemanticCache
 import os
+import re
 from dotenv import load_dotenv, find_dotenv
 from langchain_openai import ChatOpenAI
 
@@ -7,14 +11,61 @@ load_dotenv(find_dotenv())
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Keep-alive pool for the message POSTs of each HTTP/SSE server session
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64, keepalive_expiry=30)
+
+# Tools of the configured servers that only read data; the answer to a query is cached
+# only if it called no other tool
+READONLY_TOOLS = frozenset({"airbnb_search", "airbnb_listing_details", "read_notes"})
+
+# Queries mentioning any of these words are never answered from the cache
+MUTATING_INTENT = re.compile(
+    r"\b(add|create|write|save|store|insert|update|edit|modify|delete|remove|send|post|"
+    r"book|buy|pay|set|inscri\w*|ajout\w*|supprim\w*|enregistr\w*)\b",
+    re.IGNORECASE,
+)
+TIME_DEPENDENT = re.compile(
+    r"\b(time|date|today|tonight|now|current\w*|latest|recent\w*|tomorrow|yesterday|"
+    r"weather|news|price\w*|heure|aujourd'hui|maintenant|actuel\w*|derni\w*|"
+    r"r[ée]cent\w*|m[ée]t[ée]o)\b",
+    re.IGNORECASE,
+)
+
+
+def may_use_cache(query: str, payload: dict | None) -> bool:
+    """First filter for cache lookups; storing also depends on the tools the query calls."""
+    return not payload and not MUTATING_INTENT.search(query) and not TIME_DEPENDENT.search(query)
+
+
+def create_http_client(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+) -> httpx.AsyncClient:
+    """Create the httpx client used by the HTTP/SSE MCP servers of the config."""
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx.Timeout(30.0),
+        auth=auth,
+        follow_redirects=True,
+        limits=HTTP_LIMITS,
+    )
+
 
 class MCPUSE_CLIENT:
     def __init__(self, config: dict = None):
         # self.client = MCPClient.from_config_file(
         #     os.path.join(os.path.dirname(__file__), "config.json"))
-        self.client = MCPClient.from_dict(config=config)
+        self.client = MCPClient.from_dict(
+            config=config, options={"httpx_client_factory": create_http_client}
+        )
         self.llm = ChatOpenAI(
-            model_name="gpt-4o", temperature=0, api_key=OPENAI_API_KEY
+            model_name="gpt-4o",
+            temperature=0,
+            api_key=OPENAI_API_KEY,
+            streaming=True,
+            # The system prompt and tool schemas are shared by every query
+            extra_body={"prompt_cache_key": "mcp-agent-v1"},
         )
         self.agent = MCPAgent(
             llm=self.llm,
@@ -23,7 +74,70 @@ class MCPUSE_CLIENT:
             use_server_manager=True,
             verbose=True,
         )
+        # Responses to repeated read-only queries are reused for the same server set
+        self.cache = SemanticCache(threshold=0.95)
+        self.cache_key = SemanticCache.key_for_config(config)
+
+    async def start(self, warm_up: bool = False) -> None:
+        """Initialize the agent once at startup instead of on the first query.
 
-    async def process_query(self, query: str, payload: dict) -> str:
-        result = await self.agent.run(query=query, payload=payload)
+        With ``warm_up``, a one-token LLM call runs alongside the MCP connections so
+        the first query does not pay for DNS, TLS and authentication with OpenAI.
+        """
+        if warm_up:
+            await asyncio.gather(self._connect(), self._warm_up_llm())
+        else:
+            await self._connect()
+
+    async def _connect(self) -> None:
+        await self.agent.initialize()
+        # Build the server manager's per-server tool cache before the first query
+        await self.agent.server_manager.prefetch_tools()
+
+    async def _warm_up_llm(self) -> None:
+        try:
+            await self.llm.bind(max_tokens=1).ainvoke("warmup")
+        except Exception as e:
+            # Only latency is at stake; the first query will open the connection
+            print(f"LLM warm-up failed: {e}")
+
+    async def process_query(self, query: str, payload: dict | None = None) -> str:
+        embedding = None
+        if may_use_cache(query, payload):
+            # Embedding is CPU-bound; run it in a thread so concurrent queries keep going
+            embedding = await asyncio.to_thread(self.cache.embed, query)
+
+        cached = self.cache.get(embedding, self.cache_key)
+        if cached is not None:
+            return cached
+
+        generation = self.cache.generation(self.cache_key)
+        with self.agent.adapter.record_tool_calls() as called:
+            try:
+                result = await self.agent.run(query=query, payload=payload)
+            finally:
+                self._invalidate_cache_after(called, payload)
+
+        # Only answers built from read-only tools are safe to give again
+        if READONLY_TOOLS.issuperset(called):
+            self.cache.put(embedding, self.cache_key, result, generation)
         return result
+
+    async def stream_query(self, query: str, payload: dict | None = None) -> AsyncIterator[str]:
+        """Yield the answer to a query piece by piece as the LLM generates it."""
+        with self.agent.adapter.record_tool_calls() as called:
+            try:
+                async for event in self.agent.astream(query=query, payload=payload):
+                    if event["event"] == "on_chat_model_stream":
+                        content = event["data"]["chunk"].content
+                        # Chunks of tool calls carry no text for the user
+                        if content:
+                            yield content
+            finally:
+                self._invalidate_cache_after(called, payload)
+
+    def _invalidate_cache_after(self, called: list[str], payload: dict | None) -> None:
+        # Cached answers may be stale once a query has called a tool that can change
+        # state, even if it failed part way
+        if payload or not READONLY_TOOLS.issuperset(called):
+            self.cache.invalidate(self.cache_key)
@@ -1,46 +1,117 @@
+import anyio
 from mcp.server.sse import SseServerTransport
 from mcp.server.fastmcp import FastMCP
-import os
+import sqlite3
 import uvicorn
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.routing import Route, Mount
-from starlette.responses import Response
 from typing import Optional
 import logging
-logging.basicConfig(level=logging.INFO)
+
+logger = logging.getLogger(__name__)
 
 
 sse = SseServerTransport("/messages/")
 
+# FastMCP configures root logging itself; keep it at WARNING so importing the app
+# stays quiet and the INFO logs below are skipped unless the script enables them
+mcp = FastMCP("AI Sticky Notes", log_level="WARNING")  # use as an example MCP server
+_server = mcp._mcp_server
+
 
 async def handle_sse(request: Request):
-    _server = mcp._mcp_server
     async with sse.connect_sse(
         request.scope,
         request.receive,
         request._send
     ) as (reader, writer):
-        await _server.run(reader, writer, _server.create_initialization_options())
+        await _server.run(reader, writer, _init_options)
+
+
+# Resolved once at import; the database is opened once per app run, so no handler parses it
+NOTES_DB = Path(__file__).resolve().with_name("notes.db")
+NO_NOTES = "No notes found."
+
+
+def connect_db() -> sqlite3.Connection:
+    # Autocommit connection shared by the worker threads. WAL lets the other server
+    # instances read while one of them writes.
+    db = sqlite3.connect(NOTES_DB, check_same_thread=False, isolation_level=None)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS notes("
+        "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "message TEXT NOT NULL, "
+        "user_id TEXT, "
+        "created_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+    )
+    return db
+
+
+# Opened by the app lifespan, so importing this module creates no database file
+_db: Optional[sqlite3.Connection] = None
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    global _db
+    _db = connect_db()
+    try:
+        yield
+    finally:
+        _db.close()
+        _db = None
+
+
+def format_note(message: str, user_id: Optional[str]) -> str:
+    if user_id:
+        return f"Message: {message}\nUser ID: {user_id}"
+    return f"Message: {message}"
+
 
-mcp = FastMCP("AI Sticky Notes")  # use as an example MCP server
+@lru_cache(maxsize=1)
+def notes_up_to(last_id: int) -> str:
+    rows = _db.execute(
+        "SELECT message, user_id FROM notes WHERE id <= ? ORDER BY id", (last_id,)
+    ).fetchall()
+    return "\n\n".join(format_note(message, user_id) for message, user_id in rows)
 
-NOTES_FILE = os.path.join(os.path.dirname(__file__), "notes.txt")
 
+def fetch_all_notes() -> str:
+    # Notes are only ever inserted, so the highest id identifies the whole set and
+    # repeated reads between two add_note calls come from the cache
+    (last_id,) = _db.execute("SELECT MAX(id) FROM notes").fetchone()
+    return notes_up_to(last_id) if last_id is not None else ""
 
-def ensure_file():
-    if not os.path.exists(NOTES_FILE):
-        with open(NOTES_FILE, "w", encoding="utf-8") as f:
-            f.write("")
+
+async def read_all() -> str:
+    """Return all the notes, formatted; shared by the tool and the prompt."""
+    # Database I/O runs in a worker thread so other SSE clients are not blocked
+    return await anyio.to_thread.run_sync(fetch_all_notes)
+
+
+def fetch_latest_note() -> str:
+    row = _db.execute("SELECT message, user_id FROM notes ORDER BY id DESC LIMIT 1").fetchone()
+    return format_note(*row) if row else ""
+
+
+async def read_latest() -> str:
+    """Return the latest note, formatted."""
+    # Index lookup on the primary key, whatever the number of notes
+    return await anyio.to_thread.run_sync(fetch_latest_note)
 
 
 @mcp.tool()
-def add_note(
+async def add_note(
     message: str,
     user_id: Optional[str] = None,
 ) -> str:
     """
-    Add a note to the sticky notes file.
+    Add a note to the sticky notes database.
 
     Args:
         message: str: The message to add to the sticky note
@@ -49,55 +120,45 @@ def add_note(
     Returns:
       str: Confirmation message indicating that the note has been added.
     """
-    ensure_file()
-
     # Log payload information (be careful with sensitive data in production)
-    payload_info = []
-
-    if user_id:
-        payload_info.append(f"User ID: {user_id}")
-
-    if payload_info:
-        logging.info(f"Payload received: {', '.join(payload_info)}")
-    else:
-        logging.info(
-            "No payload provided. Note will be added without authentication.")
-
-    with open(NOTES_FILE, "a", encoding="utf-8") as f:
-        f.write(f"Message: {message}\n")
+    if logger.isEnabledFor(logging.INFO):
         if user_id:
-            f.write(f"User ID: {user_id}\n")
-        f.write("\n")
+            logger.info("Payload received: User ID: %s", user_id)
+        else:
+            logger.info("No payload provided. Note will be added without authentication.")
+
+    # Database I/O runs in a worker thread so other SSE clients are not blocked
+    await anyio.to_thread.run_sync(
+        _db.execute,
+        "INSERT INTO notes(message, user_id) VALUES (?, ?)",
+        (message, user_id or None),
+    )
 
     return "Note added successfully!"
 
 
 @mcp.tool()
-def read_notes() -> str:
+async def read_notes() -> str:
     """
-    Read all and return notes from the sticky notes file.
+    Read all and return notes from the sticky notes database.
 
     Returns:
-        str: The content of the sticky notes file.
+        str: All the notes, oldest first.
     """
-    ensure_file()
-    with open(NOTES_FILE, "r", encoding="utf-8") as f:
-        content = f.read().strip()
+    content = await read_all()
 
-    return content if content else "No notes found."
+    return content if content else NO_NOTES
 
 
 @mcp.resource("notes://latest")
-def get_latest_notes() -> str:
-    ensure_file()
-    with open(NOTES_FILE, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+async def get_latest_notes() -> str:
+    note = await read_latest()
 
-    return lines[-1].strip() if lines else "No notes found."
+    return note if note else NO_NOTES
 
 
 @mcp.prompt()
-def note_summary_prompt() -> str:
+async def note_summary_prompt() -> str:
     """
     Generate a prompt asking the AI to summarize all the current notes.
 
@@ -105,15 +166,17 @@ def note_summary_prompt() -> str:
         str: A prompt string that includes all notes and asks for a summary.
             If no notes are found, it returns a message indicating that.
     """
-    ensure_file()
-    with open(NOTES_FILE, "r", encoding="utf-8") as f:
-        content = f.read().strip()
+    content = await read_all()
 
     if not content:
-        return "No notes found."
+        return NO_NOTES
     return f"Summarize the current notes: {content}"
 
 
+# The server name, version and capabilities are the same for every client connection
+_init_options = _server.create_initialization_options()
+
+
 # Create the Startlette app with 2 endpoints
 # 1. /sse/ for SSE connection from clients GET request
 # 2. /messages/ for handling incoming POST messages from clients
@@ -123,7 +186,25 @@ app = Starlette(
         Route("/sse", endpoint=handle_sse),
         Mount("/messages/", app=sse.handle_post_message)
     ],
+    lifespan=lifespan,
 )
 
 if __name__ == "__main__":
-    uvicorn.run(app=app, host="localhost", port=5000)
+    # Configured only when run as a script; force replaces the handler FastMCP installed
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s", force=True
+    )
+
+    try:
+        # C event loop and HTTP parser from uvicorn[standard]; uvloop is not available on Windows
+        import httptools  # noqa: F401
+        import uvloop  # noqa: F401
+
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        loop, http = "asyncio", "h11"
+
+    # A single worker: an SSE session lives in the process that accepted GET /sse, so
+    # uvicorn workers would receive POSTs for sessions they don't know. To scale out,
+    # run several instances behind sticky routing; they can share the notes database.
+    uvicorn.run(app=app, host="localhost", port=5000, workers=1, loop=loop, http=http)
@@ -6,7 +6,7 @@ import json
 import os
 import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from mcp_use.config import create_connector_from_config, load_config_file
 from mcp_use.connectors import HttpConnector, SandboxConnector, StdioConnector, WebSocketConnector
@@ -79,6 +79,17 @@ class TestConnectorCreation(unittest.TestCase):
         )
         self.assertEqual(connector.auth_token, "test_token")
 
+    def test_create_http_connector_with_httpx_client_factory(self):
+        """Test that the httpx client factory option reaches the HTTP connector."""
+        server_config = {"url": "http://test.com"}
+        factory = Mock()
+        options: ClientOptions = {"httpx_client_factory": factory}
+
+        connector = create_connector_from_config(server_config, options)
+
+        self.assertIsInstance(connector, HttpConnector)
+        self.assertIs(connector.httpx_client_factory, factory)
+
     def test_create_http_connector_minimal(self):
         """Test creating an HTTP connector with minimal config."""
         server_config = {"url": "http://test.com"}
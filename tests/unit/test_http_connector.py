@@ -111,7 +111,9 @@ class TestHttpConnectorConnection(IsolatedAsyncioTestCase):
         await self.connector.connect()
 
         # Verify connection manager was created and started
-        mock_cm_class.assert_called_once_with("http://localhost:8000", {}, 5, 300)
+        mock_cm_class.assert_called_once_with(
+            "http://localhost:8000", {}, 5, 300, httpx_client_factory=None
+        )
         mock_cm_instance.start.assert_called_once()
 
         # Verify client session was created
@@ -378,3 +380,29 @@ class TestHttpConnectorOperations(IsolatedAsyncioTestCase):
             await self.connector.request("test_method")
 
         self.assertEqual(str(context.exception), "MCP client is not connected")
+
+
+class TestSseConnectionManagerClientFactory(IsolatedAsyncioTestCase):
+    """Tests for forwarding the httpx client factory to the SSE client."""
+
+    @patch("mcp_use.task_managers.sse.sse_client")
+    async def test_factory_not_forwarded_when_unset(self, mock_sse_client):
+        """Test that sse_client is called without a factory by default."""
+        mock_sse_client.return_value.__aenter__ = AsyncMock(return_value=("read", "write"))
+
+        manager = SseConnectionManager("http://localhost:8000")
+        streams = await manager._establish_connection()
+
+        self.assertEqual(streams, ("read", "write"))
+        self.assertNotIn("httpx_client_factory", mock_sse_client.call_args.kwargs)
+
+    @patch("mcp_use.task_managers.sse.sse_client")
+    async def test_factory_forwarded_when_set(self, mock_sse_client):
+        """Test that a configured factory reaches sse_client."""
+        mock_sse_client.return_value.__aenter__ = AsyncMock(return_value=("read", "write"))
+        factory = MagicMock()
+
+        manager = SseConnectionManager("http://localhost:8000", httpx_client_factory=factory)
+        await manager._establish_connection()
+
+        self.assertIs(mock_sse_client.call_args.kwargs["httpx_client_factory"], factory)
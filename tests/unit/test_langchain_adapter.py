@@ -0,0 +1,88 @@
+"""
+Unit tests for the LangChainAdapter class.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from mcp_use.adapters.langchain_adapter import LangChainAdapter
+
+
+def _make_tool(adapter, name, connector):
+    mcp_tool = MagicMock()
+    mcp_tool.name = name
+    mcp_tool.description = f"The {name} tool"
+    mcp_tool.inputSchema = {"type": "object", "properties": {}}
+    return adapter._convert_tool(mcp_tool, connector)
+
+
+@pytest.fixture
+def connector():
+    connector = MagicMock()
+    connector.call_tool = AsyncMock(
+        return_value=CallToolResult(content=[TextContent(type="text", text="ok")], isError=False)
+    )
+    return connector
+
+
+class TestRecordToolCalls:
+    """Tests for recording the tools called during a run."""
+
+    @pytest.mark.asyncio
+    async def test_records_tools_called_in_block(self, connector):
+        """Test that calls are recorded in order, from spawned tasks too."""
+        adapter = LangChainAdapter()
+        read_file = _make_tool(adapter, "read_file", connector)
+        move_file = _make_tool(adapter, "move_file", connector)
+
+        await read_file.ainvoke({})
+        with adapter.record_tool_calls() as calls:
+            await read_file.ainvoke({})
+            await asyncio.gather(move_file.ainvoke({}))
+        await move_file.ainvoke({})
+
+        assert calls == ["read_file", "move_file"]
+
+    @pytest.mark.asyncio
+    async def test_records_failed_calls(self, connector):
+        """Test that a tool is recorded even when calling it fails."""
+        adapter = LangChainAdapter()
+        connector.call_tool.side_effect = RuntimeError("connection lost")
+        move_file = _make_tool(adapter, "move_file", connector)
+
+        with adapter.record_tool_calls() as calls:
+            await move_file.ainvoke({})
+
+        assert calls == ["move_file"]
+
+    @pytest.mark.asyncio
+    async def test_nested_blocks_report_to_outer_block(self, connector):
+        """Test that calls recorded by an inner block also reach the outer one."""
+        adapter = LangChainAdapter()
+        read_file = _make_tool(adapter, "read_file", connector)
+
+        with adapter.record_tool_calls() as outer:
+            with adapter.record_tool_calls() as inner:
+                await read_file.ainvoke({})
+
+        assert inner == ["read_file"]
+        assert outer == ["read_file"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_blocks_are_isolated(self, connector):
+        """Test that concurrent runs only see their own tool calls."""
+        adapter = LangChainAdapter()
+        tools = {name: _make_tool(adapter, name, connector) for name in ("read_file", "move_file")}
+
+        async def run(name):
+            with adapter.record_tool_calls() as calls:
+                await asyncio.sleep(0)
+                await tools[name].ainvoke({})
+            return calls
+
+        results = await asyncio.gather(run("read_file"), run("move_file"))
+
+        assert results == [["read_file"], ["move_file"]]
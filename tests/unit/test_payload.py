@@ -5,28 +5,42 @@ This test module validates that payload data is properly injected
 into tool calls before execution without being visible to the LLM.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 from mcp_use import MCPAgent
 from mcp_use.adapters.langchain_adapter import LangChainAdapter
-from mcp_use.connectors.base import BaseConnector
 from mcp.types import CallToolResult, TextContent
+from langchain_core.agents import AgentFinish
+
+
+class _StubConnector:
+    """Connector stand-in that records tool calls and returns a fixed result."""
+
+    def __init__(self, result):
+        self.tools = []
+        self.resources = []
+        self.prompts = []
+        self._result = result
+        self.calls = []
+
+    async def call_tool(self, name, arguments):
+        self.calls.append((name, arguments))
+        return self._result
+
+
+class _StubLLM:
+    """LLM stand-in for tests that never invoke the model."""
+
+    def bind_tools(self, *args, **kwargs):
+        return self
 
 
 class TestPayloadInjection:
     """Test payload injection functionality."""
 
-    @pytest.fixture
-    def mock_connector(self):
-        """Create a mock connector for testing."""
-        connector = MagicMock(spec=BaseConnector)
-        connector.call_tool = AsyncMock()
-        connector.tools = []
-        connector.resources = []
-        connector.prompts = []
-        return connector
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_tool_result(self):
         """Create a mock tool result."""
         return CallToolResult(
@@ -36,11 +50,14 @@ class TestPayloadInjection:
         )
 
     @pytest.fixture
+    def mock_connector(self, mock_tool_result):
+        """Create a stub connector for testing; per test, since it records calls."""
+        return _StubConnector(mock_tool_result)
+
+    @pytest.fixture(scope="module")
     def mock_llm(self):
-        """Create a mock LLM for testing."""
-        llm = MagicMock()
-        llm.bind_tools = MagicMock(return_value=llm)
-        return llm
+        """Create a stub LLM for testing."""
+        return _StubLLM()
 
     def test_adapter_initialization_with_payload(self):
         """Test that LangChainAdapter can be initialized with a payload."""
@@ -108,9 +125,6 @@ class TestPayloadInjection:
         """Test that payload data is injected into tool calls."""
         payload = {"auth_token": "injection_token_def", "user_id": "user789"}
 
-        # Setup mock connector to return the mock result
-        mock_connector.call_tool.return_value = mock_tool_result
-
         # Create adapter with payload
         adapter = LangChainAdapter(payload=payload)
 
@@ -118,7 +132,7 @@ class TestPayloadInjection:
         mcp_tool = MagicMock()
         mcp_tool.name = "test_tool"
         mcp_tool.description = "A test tool"
-        mcp_tool.inputSchema = {"type": "object", "properties": {}}
+        mcp_tool.inputSchema = {"type": "object", "properties": {"test_param": {"type": "string"}}}
 
         # Convert to LangChain tool
         langchain_tool = adapter._convert_tool(mcp_tool, mock_connector)
@@ -127,11 +141,10 @@ class TestPayloadInjection:
         result = await langchain_tool.ainvoke({"test_param": "test_value"})
 
         # Verify tool was called with injected payload
-        mock_connector.call_tool.assert_called_once()
-        call_args = mock_connector.call_tool.call_args
+        assert len(mock_connector.calls) == 1
+        _, arguments = mock_connector.calls[0]
 
         # Check that payload data was injected
-        arguments = call_args[1]['arguments']
         assert arguments["auth_token"] == "injection_token_def"
         assert arguments["user_id"] == "user789"
         assert arguments["test_param"] == "test_value"
@@ -146,9 +159,6 @@ class TestPayloadInjection:
             "role": "admin"
         }
 
-        # Setup mock connector to return the mock result
-        mock_connector.call_tool.return_value = mock_tool_result
-
         # Create adapter with payload
         adapter = LangChainAdapter(payload=payload)
 
@@ -156,7 +166,10 @@ class TestPayloadInjection:
         mcp_tool = MagicMock()
         mcp_tool.name = "multi_test_tool"
         mcp_tool.description = "A test tool for multiple payload keys"
-        mcp_tool.inputSchema = {"type": "object", "properties": {}}
+        mcp_tool.inputSchema = {
+            "type": "object",
+            "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}},
+        }
 
         # Convert to LangChain tool
         langchain_tool = adapter._convert_tool(mcp_tool, mock_connector)
@@ -166,9 +179,8 @@ class TestPayloadInjection:
         result = await langchain_tool.ainvoke(user_args)
 
         # Verify tool was called with all payload keys injected
-        mock_connector.call_tool.assert_called_once()
-        call_args = mock_connector.call_tool.call_args
-        arguments = call_args[1]['arguments']
+        assert len(mock_connector.calls) == 1
+        _, arguments = mock_connector.calls[0]
 
         # Check that all payload keys were injected
         assert arguments["auth_token"] == "multi_token_123"
@@ -183,9 +195,6 @@ class TestPayloadInjection:
     @pytest.mark.asyncio
     async def test_no_payload_injection_when_none(self, mock_connector, mock_tool_result):
         """Test that no extra data is injected when payload is None."""
-        # Setup mock connector to return the mock result
-        mock_connector.call_tool.return_value = mock_tool_result
-
         # Create adapter without payload
         adapter = LangChainAdapter(payload=None)
 
@@ -193,7 +202,7 @@ class TestPayloadInjection:
         mcp_tool = MagicMock()
         mcp_tool.name = "no_payload_tool"
         mcp_tool.description = "A test tool without payload"
-        mcp_tool.inputSchema = {"type": "object", "properties": {}}
+        mcp_tool.inputSchema = {"type": "object", "properties": {"query": {"type": "string"}}}
 
         # Convert to LangChain tool
         langchain_tool = adapter._convert_tool(mcp_tool, mock_connector)
@@ -203,9 +212,8 @@ class TestPayloadInjection:
         result = await langchain_tool.ainvoke(user_args)
 
         # Verify tool was called with only user arguments
-        mock_connector.call_tool.assert_called_once()
-        call_args = mock_connector.call_tool.call_args
-        arguments = call_args[1]['arguments']
+        assert len(mock_connector.calls) == 1
+        _, arguments = mock_connector.calls[0]
 
         # Check that only user arguments are present
         assert arguments == user_args
@@ -233,3 +241,182 @@ class TestPayloadInjection:
             # Verify both agent and adapter have updated payload
             assert agent.payload == updated_payload
             assert mock_adapter.payload == updated_payload
+
+    @pytest.mark.asyncio
+    async def test_run_payload_takes_precedence(self, mock_connector, mock_tool_result):
+        """Test that a run-scoped payload overrides the adapter-wide payload."""
+        adapter = LangChainAdapter(payload={"auth_token": "default_token"})
+
+        mcp_tool = MagicMock()
+        mcp_tool.name = "run_payload_tool"
+        mcp_tool.description = "A test tool for run-scoped payloads"
+        mcp_tool.inputSchema = {"type": "object", "properties": {"query": {"type": "string"}}}
+
+        langchain_tool = adapter._convert_tool(mcp_tool, mock_connector)
+
+        token = adapter._run_payload.set({"auth_token": "run_token"})
+        try:
+            await langchain_tool.ainvoke({"query": "test query"})
+        finally:
+            adapter._run_payload.reset(token)
+
+        assert mock_connector.calls == [
+            ("run_payload_tool", {"query": "test query", "auth_token": "run_token"})
+        ]
+        # The adapter-wide payload is untouched once the run is over
+        assert adapter.active_payload == {"auth_token": "default_token"}
+
+    @pytest.mark.asyncio
+    async def test_run_payload_isolated_between_concurrent_runs(
+        self, mock_connector, mock_tool_result
+    ):
+        """Test that concurrent runs sharing one adapter inject their own payload."""
+        adapter = LangChainAdapter()
+
+        mcp_tool = MagicMock()
+        mcp_tool.name = "shared_tool"
+        mcp_tool.description = "A tool shared by concurrent runs"
+        mcp_tool.inputSchema = {"type": "object", "properties": {}}
+
+        langchain_tool = adapter._convert_tool(mcp_tool, mock_connector)
+
+        async def run(user_id):
+            adapter._run_payload.set({"user_id": user_id})
+            await asyncio.sleep(0)
+            await langchain_tool.ainvoke({})
+
+        await asyncio.gather(run("user_a"), run("user_b"))
+
+        injected = sorted(arguments["user_id"] for _, arguments in mock_connector.calls)
+        assert injected == ["user_a", "user_b"]
+        assert adapter.active_payload is None
+
+    @pytest.mark.asyncio
+    async def test_astream_scopes_payload_to_stream(self, mock_llm):
+        """Test that astream injects its payload only while the stream runs."""
+        agent = MCPAgent(llm=mock_llm, connectors=[MagicMock()], memory_enabled=False)
+        seen_payloads = []
+
+        async def fake_astream_events(inputs):
+            seen_payloads.append(agent.adapter.active_payload)
+            yield {"event": "on_chat_model_stream", "data": {}}
+
+        agent._initialized = True
+        agent._agent_executor = MagicMock()
+        agent._agent_executor.astream_events = fake_astream_events
+
+        events = [event async for event in agent.astream("hello", payload={"user_id": "u1"})]
+
+        assert len(events) == 1
+        assert seen_payloads == [{"user_id": "u1"}]
+        assert agent.adapter.active_payload is None
+
+    @pytest.mark.asyncio
+    async def test_astream_stopped_early_keeps_payload_scoped(self, mock_llm):
+        """Test that breaking out of astream neither leaks nor fails to reset the payload."""
+        agent = MCPAgent(llm=mock_llm, connectors=[MagicMock()], memory_enabled=False)
+        seen_payloads = []
+
+        async def fake_astream_events(inputs):
+            for _ in range(3):
+                seen_payloads.append(agent.adapter.active_payload)
+                yield {"event": "on_chat_model_stream", "data": {}}
+
+        agent._initialized = True
+        agent._agent_executor = MagicMock()
+        agent._agent_executor.astream_events = fake_astream_events
+
+        stream = agent.astream("hello", payload={"user_id": "u1"})
+        async for _ in stream:
+            break
+
+        assert agent.adapter.active_payload is None
+        # The generator may be finalized from another task, e.g. by the event loop
+        await asyncio.create_task(stream.aclose())
+
+        assert seen_payloads[0] == {"user_id": "u1"}
+        assert agent.adapter.active_payload is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_inject_their_own_payload(self, mock_llm, mock_connector):
+        """Test that concurrent MCPAgent.run calls each inject their own payload."""
+        default_payload = {"auth_token": "default_token"}
+        agent = MCPAgent(
+            llm=mock_llm, connectors=[MagicMock()], memory_enabled=False, payload=default_payload
+        )
+
+        mcp_tool = MagicMock()
+        mcp_tool.name = "whoami"
+        mcp_tool.description = "A tool called by both runs"
+        mcp_tool.inputSchema = {
+            "type": "object",
+            "properties": {"auth_token": {"type": "string"}, "user_id": {"type": "string"}},
+        }
+        tool = agent.adapter._convert_tool(mcp_tool, mock_connector)
+
+        async def take_next_step(**kwargs):
+            # Let the other run start before calling the tool
+            await asyncio.sleep(0)
+            await tool.ainvoke({})
+            return AgentFinish(return_values={"output": "done"}, log="")
+
+        agent._initialized = True
+        agent._tools = [tool]
+        agent._agent_executor = MagicMock()
+        agent._agent_executor._atake_next_step = take_next_step
+
+        results = await asyncio.gather(
+            agent.run("who am I?", manage_connector=False, payload={"user_id": "user_a"}),
+            agent.run("who am I?", manage_connector=False, payload={"user_id": "user_b"}),
+        )
+
+        assert results == ["done", "done"]
+        assert sorted(mock_connector.calls, key=lambda call: call[1]["user_id"]) == [
+            ("whoami", {"user_id": "user_a"}),
+            ("whoami", {"user_id": "user_b"}),
+        ]
+        # The run payloads are not kept on the agent
+        assert agent.payload == default_payload
+        assert agent.adapter.active_payload == default_payload
+
+    @pytest.mark.asyncio
+    async def test_astream_waits_for_slow_consumer(self, mock_llm):
+        """Test that the stream stops producing while the caller is not reading."""
+        agent = MCPAgent(llm=mock_llm, connectors=[MagicMock()], memory_enabled=False)
+        produced = []
+
+        async def fake_astream_events(inputs):
+            for i in range(100):
+                produced.append(i)
+                yield {"event": "on_chat_model_stream", "data": {}}
+
+        agent._initialized = True
+        agent._agent_executor = MagicMock()
+        agent._agent_executor.astream_events = fake_astream_events
+
+        stream = agent.astream("hello")
+        await anext(stream)
+        await asyncio.sleep(0.01)
+
+        assert len(produced) < 20
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_astream_raises_stream_errors(self, mock_llm):
+        """Test that an error raised while streaming reaches the caller."""
+        agent = MCPAgent(llm=mock_llm, connectors=[MagicMock()], memory_enabled=False)
+
+        async def fake_astream_events(inputs):
+            yield {"event": "on_chat_model_stream", "data": {}}
+            raise RuntimeError("LLM unavailable")
+
+        agent._initialized = True
+        agent._agent_executor = MagicMock()
+        agent._agent_executor.astream_events = fake_astream_events
+
+        events = []
+        with pytest.raises(RuntimeError, match="LLM unavailable"):
+            async for event in agent.astream("hello"):
+                events.append(event)
+
+        assert len(events) == 1
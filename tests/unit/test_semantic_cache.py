@@ -0,0 +1,131 @@
+"""
+Unit tests for the SemanticCache class.
+"""
+
+import sys
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from mcp_use.cache import SemanticCache
+
+VECTORS = {
+    "list available tools": [1.0, 0.0, 0.0],
+    "list the available tools": [0.99, 0.05, 0.0],
+    "what time is it?": [0.0, 1.0, 0.0],
+}
+
+
+def fake_embedding_function(texts):
+    return [np.array(VECTORS.get(text, [0.0, 0.0, 1.0])) for text in texts]
+
+
+class TestSemanticCache(unittest.TestCase):
+    """Tests for the SemanticCache class."""
+
+    def setUp(self):
+        """Set up a cache with a deterministic embedding function."""
+        self.cache = SemanticCache(threshold=0.95, embedding_function=fake_embedding_function)
+
+    def test_embed_normalizes_query_and_vector(self):
+        """Test that queries are whitespace/case normalized and vectors unit length."""
+        embedding = self.cache.embed("  List   AVAILABLE tools ")
+
+        np.testing.assert_allclose(embedding, [1.0, 0.0, 0.0])
+
+    def test_get_returns_similar_response(self):
+        """Test that a paraphrased query above the threshold hits the cache."""
+        self.cache.put(self.cache.embed("list available tools"), "servers", "tool list")
+
+        result = self.cache.get(self.cache.embed("list the available tools"), "servers")
+
+        self.assertEqual(result, "tool list")
+
+    def test_get_misses_below_threshold(self):
+        """Test that a dissimilar query misses the cache."""
+        self.cache.put(self.cache.embed("list available tools"), "servers", "tool list")
+
+        self.assertIsNone(self.cache.get(self.cache.embed("what time is it?"), "servers"))
+
+    def test_get_is_partitioned_by_cache_key(self):
+        """Test that responses are not shared across cache keys."""
+        self.cache.put(self.cache.embed("list available tools"), "servers_a", "tool list")
+
+        self.assertIsNone(self.cache.get(self.cache.embed("list available tools"), "servers_b"))
+
+    def test_put_evicts_oldest_entry(self):
+        """Test that the oldest entry is evicted once the cache is full."""
+        cache = SemanticCache(max_entries=1, embedding_function=fake_embedding_function)
+        cache.put(cache.embed("list available tools"), "servers", "tool list")
+        cache.put(cache.embed("what time is it?"), "servers", "noon")
+
+        self.assertIsNone(cache.get(cache.embed("list available tools"), "servers"))
+        self.assertEqual(cache.get(cache.embed("what time is it?"), "servers"), "noon")
+
+    def test_missing_embedding_disables_cache(self):
+        """Test that a None embedding is neither stored nor matched."""
+        self.cache.put(None, "servers", "tool list")
+
+        self.assertIsNone(self.cache.get(None, "servers"))
+
+    def test_key_for_config_is_order_independent(self):
+        """Test that the config key does not depend on dict ordering."""
+        config_a = {"mcpServers": {"a": {"url": "x"}, "b": {"url": "y"}}}
+        config_b = {"mcpServers": {"b": {"url": "y"}, "a": {"url": "x"}}}
+
+        self.assertEqual(
+            SemanticCache.key_for_config(config_a), SemanticCache.key_for_config(config_b)
+        )
+
+    def test_get_skips_expired_entries(self):
+        """Test that a response is no longer returned once its TTL has passed."""
+        cache = SemanticCache(ttl=60, embedding_function=fake_embedding_function)
+        with patch("mcp_use.cache.semantic_cache.time.monotonic", return_value=1000.0):
+            cache.put(cache.embed("list available tools"), "servers", "tool list")
+
+        with patch("mcp_use.cache.semantic_cache.time.monotonic", return_value=1059.0):
+            self.assertEqual(cache.get(cache.embed("list available tools"), "servers"), "tool list")
+        with patch("mcp_use.cache.semantic_cache.time.monotonic", return_value=1061.0):
+            self.assertIsNone(cache.get(cache.embed("list available tools"), "servers"))
+
+    def test_invalidate_clears_only_its_partition(self):
+        """Test that invalidating a cache key leaves other partitions untouched."""
+        self.cache.put(self.cache.embed("list available tools"), "servers_a", "tool list a")
+        self.cache.put(self.cache.embed("list available tools"), "servers_b", "tool list b")
+
+        self.cache.invalidate("servers_a")
+
+        self.assertIsNone(self.cache.get(self.cache.embed("list available tools"), "servers_a"))
+        self.assertEqual(
+            self.cache.get(self.cache.embed("list available tools"), "servers_b"), "tool list b"
+        )
+
+    def test_put_drops_response_computed_before_invalidation(self):
+        """Test that a response started before an invalidation is not stored."""
+        generation = self.cache.generation("servers")
+        self.cache.invalidate("servers")
+
+        self.cache.put(self.cache.embed("list available tools"), "servers", "stale", generation)
+
+        self.assertIsNone(self.cache.get(self.cache.embed("list available tools"), "servers"))
+
+    def test_model_is_loaded_once_by_concurrent_threads(self):
+        """Test that threads embedding at cold start share a single model load."""
+        loads = []
+
+        def text_embedding(model_name):
+            loads.append(model_name)
+            time.sleep(0.05)
+            return MagicMock()
+
+        cache = SemanticCache()
+        fastembed = MagicMock(TextEmbedding=text_embedding)
+        with patch.dict(sys.modules, {"fastembed": fastembed}):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(lambda _: cache._load_model(), range(4)))
+
+        self.assertEqual(results, [True] * 4)
+        self.assertEqual(len(loads), 1)
@@ -0,0 +1,72 @@
+"""
+Unit tests for the ServerManager class.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mcp_use.managers.server_manager import ServerManager
+
+
+class TestServerManagerPrefetch:
+    """Tests for prefetching server tools."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_tools_caches_tools_per_server(self):
+        """Test that prefetch_tools loads and caches the tools of every server."""
+        session = MagicMock()
+        client = MagicMock()
+        client.get_server_names.return_value = ["notes"]
+        client.get_session.return_value = session
+        adapter = MagicMock()
+        tools = [MagicMock(name="add_note")]
+        adapter._create_tools_from_connectors = AsyncMock(return_value=tools)
+
+        manager = ServerManager(client, adapter)
+        await manager.prefetch_tools()
+
+        adapter._create_tools_from_connectors.assert_awaited_once_with([session.connector])
+        assert manager._server_tools == {"notes": tools}
+        assert manager.initialized_servers == {"notes": True}
+        client.create_session.assert_not_called()
+
+
+class TestServerManagerRunScope:
+    """Tests for scoping the active server to a single run."""
+
+    @pytest.mark.asyncio
+    async def test_active_server_isolated_between_concurrent_runs(self):
+        """Test that concurrent runs never switch each other's active server."""
+        manager = ServerManager(MagicMock(), MagicMock())
+        seen = {}
+
+        async def run(server_name, started, other_started):
+            with manager.run_scope():
+                manager.active_server = server_name
+                started.set()
+                await other_started.wait()
+                seen[server_name] = manager.active_server
+
+        first, second = asyncio.Event(), asyncio.Event()
+        await asyncio.gather(run("notes", first, second), run("weather", second, first))
+
+        assert seen == {"notes": "notes", "weather": "weather"}
+        assert manager.active_server is None
+
+    def test_run_scope_persists_active_server_when_asked(self):
+        """Test that the run's active server is kept only with persist=True."""
+        manager = ServerManager(MagicMock(), MagicMock())
+
+        with manager.run_scope():
+            manager.active_server = "notes"
+        assert manager.active_server is None
+
+        with manager.run_scope(persist=True):
+            assert manager.active_server is None
+            manager.active_server = "notes"
+        assert manager.active_server == "notes"
+
+        with manager.run_scope():
+            assert manager.active_server == "notes"